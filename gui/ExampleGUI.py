@@ -1,5 +1,85 @@
-from typing import Any, List, Optional, Tuple
-import tkinter as tk
+import time
+import zlib
+from itertools import chain
+from typing import TYPE_CHECKING, Any, Callable, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    # Imported lazily at runtime so headless runs never load Tcl/Tk.
+    import tkinter as tk
+
+
+# Small HSL→RGB utility (no external dependencies)
+def _hsl_to_rgb(h: float, s: float, l: float) -> Tuple[float, float, float]:
+    def hue_to_rgb(p, q, t):
+        if t < 0:
+            t += 1
+        if t > 1:
+            t -= 1
+        if t < 1/6:
+            return p + (q - p) * 6 * t
+        if t < 1/2:
+            return q
+        if t < 2/3:
+            return p + (q - p) * (2/3 - t) * 6
+        return p
+
+    if s == 0:
+        r = g = b = l
+    else:
+        q = l * (1 + s) if l < 0.5 else l + s - l * s
+        p = 2 * l - q
+        r = hue_to_rgb(p, q, h + 1/3)
+        g = hue_to_rgb(p, q, h)
+        b = hue_to_rgb(p, q, h - 1/3)
+    return r, g, b
+
+
+def _hsl_hex(h: float, s: float, l: float) -> str:
+    r, g, b = _hsl_to_rgb(h, s, l)
+    return f"#{int(r*255):02x}{int(g*255):02x}{int(b*255):02x}"
+
+
+# Minimum seconds between Tk idle-task flushes triggered by `update()` (~60 fps).
+_FLUSH_INTERVAL = 1 / 60
+
+# 512 pastel hues (power of two, so buckets are picked with a mask); saturation
+# and lightness are fixed.
+_PALETTE_MASK = 511
+_PALETTE: Tuple[str, ...] = tuple(_hsl_hex(i / 512, 0.45, 0.72) for i in range(_PALETTE_MASK + 1))
+
+
+def _specialize(rows: int, cols: int, cell_px: int) -> Tuple[Callable[[Any], None], Callable[[int, int], Tuple[float, ...]]]:
+    """
+    Generate drawing helpers with the grid shape and cell size baked in as literals.
+
+    Returns
+    -------
+    (paint_grid, disc_box)
+        - `paint_grid(canvas)` draws the background and all grid lines, fully unrolled.
+        - `disc_box(col, row)` returns `(x1, y1, x2, y2, cx, cy)` for an agent disc.
+    """
+    width = cols * cell_px
+    height = rows * cell_px
+    half = cell_px / 2
+    radius = cell_px * 0.35
+
+    # One background rectangle plus rows+cols+2 lines instead of one item per cell
+    lines = [
+        "def paint_grid(canvas):",
+        f"    canvas.create_rectangle(0, 0, {width}, {height}, outline='', fill='#17171F')",
+    ]
+    lines += [f"    canvas.create_line(0, {r * cell_px}, {width}, {r * cell_px}, fill='#2A2A33')" for r in range(rows + 1)]
+    lines += [f"    canvas.create_line({c * cell_px}, 0, {c * cell_px}, {height}, fill='#2A2A33')" for c in range(cols + 1)]
+    lines += [
+        "def disc_box(col, row):",
+        f"    cx = col * {cell_px} + {half!r}",
+        f"    cy = row * {cell_px} + {half!r}",
+        f"    return cx - {radius!r}, cy - {radius!r}, cx + {radius!r}, cy + {radius!r}, cx, cy",
+    ]
+
+    namespace: dict[str, Any] = {}
+    exec(compile("\n".join(lines), f"<ExampleGUI {rows}x{cols}@{cell_px}px>", "exec"), namespace)
+    return namespace["paint_grid"], namespace["disc_box"]
 
 
 class ExampleGUI:
@@ -9,13 +89,15 @@ class ExampleGUI:
     Contract
     --------
     - Expects `env.level_matrix` as `List[List[List[Any]]]`.
-    - Calls to `update()` fully redraw the view (idempotent).
-    - Headless if no Tk root is attached.
+    - Uses `env.occupants` (`{(row, col): cell}` of non-empty cells) when present,
+      so per-frame work scales with the number of agents rather than grid area.
+    - Calls to `update()` repaint only cells whose contents changed (idempotent).
+    - Headless if no Tk root is attached; `tkinter` is only imported once a root is.
 
     Responsibilities
     ----------------
     - Paint a rectilinear grid.
-    - Draw agents (objects with a `name` attribute) as labeled discs.
+    - Draw agents (objects with a non-empty string `name` attribute) as labeled discs.
     - Keep per-label colors stable via a deterministic cache.
 
     Non-Responsibilities
@@ -28,7 +110,7 @@ class ExampleGUI:
     - Short labels to reduce clutter at small cell sizes.
     """
 
-    def __init__(self, env: Any, root: Optional[tk.Misc] = None, *, cell_px: int = 40) -> None:
+    def __init__(self, env: Any, root: Optional["tk.Misc"] = None, *, cell_px: int = 40) -> None:
         """
         Initialize the view.
 
@@ -42,11 +124,27 @@ class ExampleGUI:
             Pixel size for square cells. Clamped to a sane minimum.
         """
         self.env = env
-        self.root: Optional[tk.Misc] = root
+        self.root: Optional["tk.Misc"] = root
         self.cell_px = max(8, int(cell_px))
-        self.canvas: Optional[tk.Canvas] = None
+        self.canvas: Optional["tk.Canvas"] = None
         self._color_cache: dict[str, str] = {}
 
+        # Per-agent drawing constants derived from cell_px, and short labels per label
+        self._font = ("TkDefaultFont", max(8, int(self.cell_px * 0.28)), "bold")
+        self._short_cache: dict[str, str] = {}
+
+        # Dirty-cell bookkeeping: canvas items and drawn labels per (row, col)
+        self._cell_items: dict[Tuple[int, int], List[int]] = {}
+        self._cell_hash: dict[Tuple[int, int], Tuple[str, ...]] = {}
+        self._grid_shape: Tuple[int, int] = (0, 0)
+
+        # Drawing helpers specialized for the current grid shape; rebuilt on resize
+        self._specialized_for: Tuple[int, int] = (0, 0)
+        self._paint_grid, self._disc_box = _specialize(0, 0, self.cell_px)
+
+        # Monotonic timestamp of the last idle-task flush
+        self._last_flush = 0.0
+
         if self.root is not None:
             self._ensure_canvas()
             self.update()
@@ -54,44 +152,81 @@ class ExampleGUI:
     # ---------- Public API ----------
     def update(self) -> None:
         """
-        Redraw the entire matrix. Safe to call frequently.
+        Repaint cells whose contents changed since the last call. Safe to call frequently.
 
         Notes
         -----
-        - Full repaint keeps logic simple and avoids stale artifacts.
-        - For very large grids, consider dirty-rect optimizations upstream.
+        - Grid items persist and are only rebuilt when the grid size changes.
+        - Each cell is keyed by the labels drawn in it; unchanged cells are skipped.
+        - If more than half of all cells changed, a full repaint is cheaper than
+          per-cell item churn and is used instead.
+        - Pending Tk redraws are flushed at most once per `_FLUSH_INTERVAL`;
+          call `flush()` when a synchronous final paint is required.
         """
-        if self.canvas is None:
+        canvas = self.canvas
+        if canvas is None:
             return
 
         matrix: List[List[List[Any]]] = self.env.level_matrix
         rows = len(matrix)
         cols = len(matrix[0]) if rows else 0
 
-        self._resize_canvas(cols, rows)
-        self.canvas.delete("all")
+        if (rows, cols) != self._grid_shape:
+            self._resize_canvas(cols, rows)
+            self._draw_grid(rows, cols)
+
+        # Occupied cells: from the sparse index if the environment keeps one,
+        # otherwise from a single flat pass that skips empty cells cheaply
+        occupants = getattr(self.env, "occupants", None)
+        if occupants is not None:
+            cells = occupants.items()
+        else:
+            cells = (
+                (divmod(idx, cols), cell)
+                for idx, cell in enumerate(chain.from_iterable(matrix))
+                if cell
+            )
+
+        # One fused pass: collect labels per occupied cell and flag changed ones
+        drawn = self._cell_hash
+        signature = self._cell_signature
+        current: dict[Tuple[int, int], Tuple[str, ...]] = {}
+        dirty: List[Tuple[Tuple[int, int], Tuple[str, ...]]] = []
+        for key, cell in cells:
+            sig = signature(cell)
+            if sig:
+                current[key] = sig
+                if drawn.get(key) != sig:
+                    dirty.append((key, sig))
+
+        # Cells that were drawn before but are empty now
+        dirty.extend((key, ()) for key in drawn if key not in current)
+
+        draw = self._draw_cell
+        if len(dirty) * 2 > rows * cols:
+            # Major dirty overlap: fall back to a full repaint
+            self._draw_grid(rows, cols)
+            for (r, c), sig in current.items():
+                draw(canvas, r, c, sig)
+        else:
+            for (r, c), sig in dirty:
+                draw(canvas, r, c, sig)
 
-        # Grid
-        for r in range(rows):
-            for c in range(cols):
-                x1, y1, x2, y2 = self._cell_bounds(c, r)
-                self.canvas.create_rectangle(x1, y1, x2, y2, outline="#2A2A33", fill="#17171F")
-
-        # Agents
-        for r in range(rows):
-            for c in range(cols):
-                cell = matrix[r][c]
-                # Draw any object that exposes a non-empty string `name`
-                for obj in cell:
-                    if obj is None:
-                        continue
-                    label = getattr(obj, "name", None)
-                    if isinstance(label, str) and label:
-                        self._draw_agent(c, r, label)
+        now = time.monotonic()
+        if now - self._last_flush >= _FLUSH_INTERVAL:
+            canvas.update_idletasks()
+            self._last_flush = now
 
+    def flush(self) -> None:
+        """
+        Process pending Tk redraws immediately, e.g. before taking a screenshot.
+        """
+        if self.canvas is None:
+            return
         self.canvas.update_idletasks()
+        self._last_flush = time.monotonic()
 
-    def set_root(self, root: tk.Misc) -> None:
+    def set_root(self, root: "tk.Misc") -> None:
         """
         Attach a Tk root after construction. Enables rendering if previously headless.
         """
@@ -105,45 +240,100 @@ class ExampleGUI:
             return
         rows = len(self.env.level_matrix)
         cols = len(self.env.level_matrix[0]) if rows else 0
+        import tkinter as tk
+
         w = max(1, cols * self.cell_px)
         h = max(1, rows * self.cell_px)
         self.canvas = tk.Canvas(self.root, width=w, height=h, bg="#101014", highlightthickness=0)
         self.canvas.pack(fill="both", expand=False)
+        self._draw_grid(rows, cols)
+
+    def _draw_grid(self, rows: int, cols: int) -> None:
+        """
+        Clear the canvas and paint the persistent grid background and lines.
+
+        All per-cell bookkeeping is reset, so every occupied cell is dirty afterwards.
+        """
+        assert self.canvas is not None
+        self.canvas.delete("all")
+        self._cell_items.clear()
+        self._cell_hash.clear()
+        self._grid_shape = (rows, cols)
+        if not rows or not cols:
+            return
+
+        # Grid shape and cell size are fixed between resizes: specialize once, replay per repaint
+        if self._specialized_for != (rows, cols):
+            self._paint_grid, self._disc_box = _specialize(rows, cols, self.cell_px)
+            self._specialized_for = (rows, cols)
+        self._paint_grid(self.canvas)
+
+    @staticmethod
+    def _cell_signature(cell: List[Any]) -> Tuple[str, ...]:
+        """
+        Return the labels drawn for a cell: every object exposing a non-empty `name`.
+
+        Names are trusted to be strings; `AgentConstruct` validates this at construction.
+        """
+        labels = []
+        for obj in cell:
+            if obj is None:
+                continue
+            # Agents nearly always expose `name`; plain attribute access is the fast path.
+            try:
+                label = obj.name
+            except AttributeError:
+                continue
+            if label:
+                labels.append(label)
+        return tuple(labels)
+
+    def _draw_cell(self, canvas: "tk.Canvas", row: int, col: int, sig: Tuple[str, ...]) -> None:
+        """
+        Replace the agent items of one cell with discs for `sig`.
+        """
+        key = (row, col)
+        stale = self._cell_items.pop(key, None)
+        if stale:
+            canvas.delete(*stale)
+
+        items: List[int] = []
+        for label in sig:
+            items.extend(self._draw_agent(canvas, col, row, label))
+        if items:
+            self._cell_items[key] = items
+        if sig:
+            self._cell_hash[key] = sig
+        else:
+            self._cell_hash.pop(key, None)
 
     def _resize_canvas(self, cols: int, rows: int) -> None:
         if self.canvas is None:
             return
         self.canvas.config(width=max(1, cols * self.cell_px), height=max(1, rows * self.cell_px))
 
-    def _cell_bounds(self, col: int, row: int) -> Tuple[int, int, int, int]:
-        x1 = col * self.cell_px
-        y1 = row * self.cell_px
-        x2 = x1 + self.cell_px
-        y2 = y1 + self.cell_px
-        return x1, y1, x2, y2
-
-    def _draw_agent(self, col: int, row: int, label: str) -> None:
+    def _draw_agent(self, canvas: "tk.Canvas", col: int, row: int, label: str) -> Tuple[int, int]:
         """
-        Render a filled circle with a compact label.
+        Render a filled circle with a compact label and return both canvas item ids.
+
+        The canvas is passed in by `update()`, which has already checked that it exists.
 
         Label policy
         ------------
         - Up to 4 characters to remain readable at small sizes.
+        - Labels are agent names, which `AgentConstruct` interns once, so
+          cache lookups on the small fixed label set compare by identity.
         """
-        x1, y1, x2, y2 = self._cell_bounds(col, row)
-        cx = (x1 + x2) / 2
-        cy = (y1 + y2) / 2
-        r = self.cell_px * 0.35
+        x1, y1, x2, y2, cx, cy = self._disc_box(col, row)
 
         color = self._color_for(label)
-        assert self.canvas is not None
-        self.canvas.create_oval(cx - r, cy - r, cx + r, cy + r, fill=color, outline="#ECECF1", width=1)
+        oval = canvas.create_oval(x1, y1, x2, y2, fill=color, outline="#ECECF1", width=1)
 
-        short = (label or "A")[:4]
-        self.canvas.create_text(
-            cx, cy, text=short, fill="#0B0B0D",
-            font=("TkDefaultFont", max(8, int(self.cell_px * 0.28)), "bold")
-        )
+        short = self._short_cache.get(label)
+        if short is None:
+            short = self._short_cache.setdefault(label, (label or "A")[:4])
+        text = canvas.create_text(cx, cy, text=short, fill="#0B0B0D", font=self._font)
+        return oval, text
 
     def _color_for(self, key: str) -> str:
         """
@@ -151,38 +341,8 @@ class ExampleGUI:
 
         Determinism
         -----------
-        - Based on Python's hash of the label; cached for stability within a run.
-        """
-        hit = self._color_cache.get(key)
-        if hit:
-            return hit
-        h = abs(hash(key)) % 360
-        r, g, b = self._hsl_to_rgb(h / 360.0, 0.45, 0.72)
-        hexcol = f"#{int(r*255):02x}{int(g*255):02x}{int(b*255):02x}"
-        self._color_cache[key] = hexcol
-        return hexcol
-
-    # Small HSL→RGB utility (no external dependencies)
-    def _hsl_to_rgb(self, h: float, s: float, l: float):
-        def hue_to_rgb(p, q, t):
-            if t < 0:
-                t += 1
-            if t > 1:
-                t -= 1
-            if t < 1/6:
-                return p + (q - p) * 6 * t
-            if t < 1/2:
-                return q
-            if t < 2/3:
-                return p + (q - p) * (2/3 - t) * 6
-            return p
-
-        if s == 0:
-            r = g = b = l
-        else:
-            q = l * (1 + s) if l < 0.5 else l + s - l * s
-            p = 2 * l - q
-            r = hue_to_rgb(p, q, h + 1/3)
-            g = hue_to_rgb(p, q, h)
-            b = hue_to_rgb(p, q, h - 1/3)
-        return r, g, b
+        - Based on the CRC32 of the label, so colors are stable across runs
+          (unlike Python's randomized `hash`).
+        - Colors come from the precomputed 512-entry `_PALETTE`.
+        """
+        return self._color_cache.setdefault(key, _PALETTE[zlib.crc32(key.encode()) & _PALETTE_MASK])
@@ -1,3 +1,8 @@
+import sys
+
+from simulation.pyactrFunctionalityExtension import track_declarative_memory
+
+
 class AgentConstruct:
     """
     Container class connecting an ACT-R agent, its environment bindings,
@@ -36,7 +41,16 @@ class AgentConstruct:
             Display identifier, typically the full name used in GUI rendering.
         los : int
             Line-of-sight distance for perceptual range.
+
+        Raises
+        ------
+        ValueError
+            If `name` is not a non-empty string. The GUI relies on this and
+            does not re-check labels per frame.
         """
+        if not (isinstance(name, str) and name):
+            raise ValueError(f"Agent name must be a non-empty string, got {name!r}.")
+
         # --- ACT-R binding and synchronization ---
         self.realtime = False                # Whether to run in ACT-R real-time mode (computationally heavy).
         self.actr_agent = None               # Core pyACT-R agent instance (Lisp model equivalent).
@@ -47,7 +61,7 @@ class AgentConstruct:
         self.actr_construct = None           # Placeholder for future replacement; deprecated internal reference.
 
         # --- Metadata and runtime identifiers ---
-        self.name = name
+        self.name = sys.intern(str(name))    # Interned once; the GUI keys its label caches on it.
         self.name_number = name_number       # Public GUI identifier, used to bind visuals to agents.
         self.actr_time = 0.0                 # Local cognitive time, synced with simulation clock.
         self.middleman = middleman
@@ -63,8 +77,16 @@ class AgentConstruct:
     # Initialization utilities
     # ---------------------------
     def set_actr_agent(self, actr_agent):
-        """Assign the ACT-R agent safely to avoid circular initialization deadlocks."""
+        """
+        Assign the ACT-R agent safely to avoid circular initialization deadlocks.
+
+        Also enables change tracking on the agent's declarative memory, which
+        lets the declarative helpers in `pyactrFunctionalityExtension` keep
+        their typename index across calls.
+        """
         self.actr_agent = actr_agent
+        if actr_agent is not None:
+            track_declarative_memory(actr_agent)
 
     def set_actr_adapter(self, actr_adapter):
         """
@@ -1,6 +1,95 @@
-from typing import Any, List, Optional, Tuple, Type
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Iterable, List, Optional, Tuple, Type
 import importlib
-import inspect
+import sys
+
+
+# ---------------------------------------------------------------------- #
+# Class resolution                                                       #
+# ---------------------------------------------------------------------- #
+
+def _first_local_class(module) -> Optional[Type[Any]]:
+    """
+    Return the first class defined in ``module`` or ``None``.
+
+    This is used as a fallback if the expected class name is not
+    available but the module still defines a single relevant class.
+    """
+    # Walk the module namespace directly; inspect.getmembers would getattr
+    # and sort every attribute just to find one class.
+    mod_name = module.__name__
+    for obj in vars(module).values():
+        if isinstance(obj, type) and obj.__module__ == mod_name:
+            return obj
+    return None
+
+
+@lru_cache(maxsize=None)
+def _resolve(base_package: str, name: str) -> Tuple[Type[Any], Type[Any]]:
+    """
+    Resolve runner and adapter classes for a logical agent type.
+
+    Results are memoized per ``(base_package, name)``, so each agent
+    module is imported and inspected only once per process.
+
+    Parameters
+    ----------
+    base_package : str
+        Python package that contains all agent and adapter modules.
+    name : str
+        Logical agent name, e.g. ``"Example"``.
+
+    Returns
+    -------
+    (Type, Type)
+        Tuple ``(runner_class, adapter_class)``.
+
+    Raises
+    ------
+    ValueError
+        If modules or classes cannot be found according to the
+        naming convention.
+    """
+    runner_module_name = f"{base_package}.{name}"
+    adapter_module_name = f"{base_package}.{name}Adapter"
+
+    try:
+        runner_module = importlib.import_module(runner_module_name)
+    except ImportError as exc:
+        raise ValueError(
+            f"Could not import runner module '{runner_module_name}' "
+            f"for agent type {name!r}. "
+            f"Expected a file '{name}.py' in package '{base_package}'."
+        ) from exc
+
+    try:
+        adapter_module = importlib.import_module(adapter_module_name)
+    except ImportError as exc:
+        raise ValueError(
+            f"Could not import adapter module '{adapter_module_name}' "
+            f"for agent type {name!r}. "
+            f"Expected a file '{name}Adapter.py' in package '{base_package}'."
+        ) from exc
+
+    runner_cls = getattr(runner_module, name, None)
+    adapter_cls = getattr(adapter_module, f"{name}Adapter", None)
+
+    # Fallback: use first locally defined class if the expected
+    # class name is not present.
+    if runner_cls is None:
+        runner_cls = _first_local_class(runner_module)
+    if adapter_cls is None:
+        adapter_cls = _first_local_class(adapter_module)
+
+    if runner_cls is None or adapter_cls is None:
+        raise ValueError(
+            f"Could not resolve classes for agent type {name!r}. "
+            f"Expected class '{name}' in '{runner_module_name}' and "
+            f"'{name}Adapter' in '{adapter_module_name}'."
+        )
+
+    return runner_cls, adapter_cls
 
 
 class AgentTypeReturner:
@@ -19,11 +108,15 @@ class AgentTypeReturner:
 
     Notes
     -----
-    - The special type ``"Human"`` returns ``None`` because human
-      participants are controlled externally.
-    - Resolved classes are cached per type name to avoid repeated imports.
+    - Types listed in ``_EXTERNAL_TYPES`` (currently only ``"Human"``)
+      return ``None`` because those participants are controlled externally.
+    - Resolved classes are cached process-wide per ``(base_package, name)``
+      to avoid repeated imports.
     """
 
+    # Agent types controlled outside ACT-R; no model is instantiated for them.
+    _EXTERNAL_TYPES = frozenset({"Human"})
+
     def __init__(self, base_package: str = "agents") -> None:
         """
         Parameters
@@ -33,103 +126,49 @@ class AgentTypeReturner:
             By default, this is ``"agents"``.
         """
         self.base_package = base_package
-        self._cache: dict[str, Tuple[Type[Any], Type[Any]]] = {}
 
     # ------------------------------------------------------------------ #
     # Internal helpers                                                   #
     # ------------------------------------------------------------------ #
 
-    def _import_module(self, fullname: str):
+    def _resolve_agent_classes(self, name: str) -> Tuple[Type[Any], Type[Any]]:
         """
-        Import a module by fully qualified name and return it.
+        Resolve runner and adapter classes for a logical agent type.
 
-        Raises
-        ------
-        ImportError
-            If the module cannot be imported.
+        Thin wrapper around the module-level, memoized :func:`_resolve`.
         """
-        return importlib.import_module(fullname)
+        return _resolve(self.base_package, name)
 
-    @staticmethod
-    def _first_local_class(module) -> Optional[Type[Any]]:
-        """
-        Return the first class defined in ``module`` or ``None``.
+    # ------------------------------------------------------------------ #
+    # Public API                                                         #
+    # ------------------------------------------------------------------ #
 
-        This is used as a fallback if the expected class name is not
-        available but the module still defines a single relevant class.
+    def prewarm(self, names: Iterable[str]) -> None:
         """
-        for _, obj in inspect.getmembers(module, inspect.isclass):
-            if obj.__module__ == module.__name__:
-                return obj
-        return None
+        Resolve several agent types up front, importing their modules in parallel.
 
-    def _resolve_agent_classes(self, name: str) -> Tuple[Type[Any], Type[Any]]:
-        """
-        Resolve runner and adapter classes for a logical agent type.
+        Module imports spend much of their time in filesystem I/O, so a
+        small thread pool shortens cold start when many distinct agent
+        types are configured. Afterwards :meth:`return_agent_type` only
+        hits the resolution cache.
 
         Parameters
         ----------
-        name : str
-            Logical agent name, e.g. ``"Example"``.
-
-        Returns
-        -------
-        (Type, Type)
-            Tuple ``(runner_class, adapter_class)``.
+        names : Iterable[str]
+            Logical agent type names. Duplicates and externally controlled
+            types are ignored.
 
         Raises
         ------
         ValueError
-            If modules or classes cannot be found according to the
-            naming convention.
+            If any ``name`` cannot be resolved as an agent type.
         """
-        if name in self._cache:
-            return self._cache[name]
-
-        runner_module_name = f"{self.base_package}.{name}"
-        adapter_module_name = f"{self.base_package}.{name}Adapter"
-
-        try:
-            runner_module = self._import_module(runner_module_name)
-        except ImportError as exc:
-            raise ValueError(
-                f"Could not import runner module '{runner_module_name}' "
-                f"for agent type {name!r}. "
-                f"Expected a file '{name}.py' in package '{self.base_package}'."
-            ) from exc
-
-        try:
-            adapter_module = self._import_module(adapter_module_name)
-        except ImportError as exc:
-            raise ValueError(
-                f"Could not import adapter module '{adapter_module_name}' "
-                f"for agent type {name!r}. "
-                f"Expected a file '{name}Adapter.py' in package '{self.base_package}'."
-            ) from exc
-
-        runner_cls = getattr(runner_module, name, None)
-        adapter_cls = getattr(adapter_module, f"{name}Adapter", None)
-
-        # Fallback: use first locally defined class if the expected
-        # class name is not present.
-        if runner_cls is None:
-            runner_cls = self._first_local_class(runner_module)
-        if adapter_cls is None:
-            adapter_cls = self._first_local_class(adapter_module)
-
-        if runner_cls is None or adapter_cls is None:
-            raise ValueError(
-                f"Could not resolve classes for agent type {name!r}. "
-                f"Expected class '{name}' in '{runner_module_name}' and "
-                f"'{name}Adapter' in '{adapter_module_name}'."
-            )
-
-        self._cache[name] = (runner_cls, adapter_cls)
-        return runner_cls, adapter_cls
-
-    # ------------------------------------------------------------------ #
-    # Public API                                                         #
-    # ------------------------------------------------------------------ #
+        unique = {sys.intern(n) for n in names if n not in self._EXTERNAL_TYPES}
+        if not unique:
+            return
+        with ThreadPoolExecutor(max_workers=min(8, len(unique))) as pool:
+            # Consume the results so resolution errors surface here.
+            list(pool.map(self._resolve_agent_classes, unique))
 
     def return_agent_type(
         self,
@@ -152,7 +191,8 @@ class AgentTypeReturner:
         Returns
         -------
         Optional[Tuple[Any, Any, Any]]
-            - ``None`` for human players (manual input elsewhere).
+            - ``None`` for externally controlled types such as human
+              players (manual input elsewhere).
             - Tuple ``(runner, actr_agent, adapter)`` for modeled agents.
 
         Raises
@@ -160,11 +200,13 @@ class AgentTypeReturner:
         ValueError
             If ``name`` cannot be resolved as an agent type.
         """
-        if name == "Human":
+        if name in self._EXTERNAL_TYPES:
             # Human participants are controlled externally; no ACT-R instance.
             return None
 
-        runner_cls, adapter_cls = self._resolve_agent_classes(name)
+        # Agent type names form a tiny fixed set; interning makes cache keys identity-comparable.
+        name = sys.intern(name)
+        runner_cls, adapter_cls = _resolve(self.base_package, name)
 
         # Runner encapsulates the ACT-R model; adapter bridges sim ↔ agent I/O.
         runner = runner_cls(actr_environment)
@@ -1,6 +1,11 @@
-from typing import Any, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 from gui.ExampleGUI import ExampleGUI
 
+def _is_occupied(cell: List[Any]) -> bool:
+    """Return True if the cell holds at least one object besides `None` placeholders."""
+    return any(obj is not None for obj in cell)
+
+
 class Environment:
     """
     Minimal grid-based environment for agent movement.
@@ -24,6 +29,11 @@ class Environment:
     -----
     - Cell contents are lists of objects; multiple agents may share a cell if
       the simulation allows it.
+    - `occupants` is a sparse view of the grid mapping `(row, col)` to the
+      cell list of every cell holding an object (`None` placeholders of
+      never-occupied cells do not count). It shares the list objects with
+      `level_matrix` and is kept in sync by the movement and lifecycle API;
+      mutate cells through those methods rather than directly.
     - `remove_agent_from_game` removes an agent and lets the simulation proceed.
       Use this to continue after an agent hits an internal error.
     """
@@ -35,17 +45,27 @@ class Environment:
         Parameters
         ----------
         level_matrix : 2D list
-            Matrix of cells. Each cell may be a single object or a list of objects.
+            Matrix of cells. Each cell may be `None`, a single object or a list of objects.
         gui : Optional[Any]
             Optional GUI handle. If provided, `_update_gui()` will invoke `gui.update()`.
             For a visible environment, create and wire the GUI here.
         """
         # Normalize cells to lists to allow multiple occupants per cell.
+        # Empty cells keep their `None` placeholder (`[None]`); `Middleman`
+        # renders those differently from cells an agent has left (`[]`).
         self.level_matrix: List[List[List[Any]]] = [
             [cell if isinstance(cell, list) else [cell] for cell in row]
             for row in level_matrix
         ]
 
+        # Sparse view of occupied cells; lookups scale with agents, not grid area.
+        self.occupants: Dict[Tuple[int, int], List[Any]] = {
+            (r, c): cell
+            for r, row in enumerate(self.level_matrix)
+            for c, cell in enumerate(row)
+            if _is_occupied(cell)
+        }
+
         # Optional GUI; not required for headless simulations.
         self.gui = ExampleGUI(self, gui)
         self._update_gui()
@@ -58,6 +78,20 @@ class Environment:
         if self.gui and hasattr(self.gui, "update"):
             self.gui.update()
 
+    def _remove_from_cell(self, agent: Any, r: int, c: int) -> None:
+        """
+        Remove `agent` from cell (r, c) and drop the cell from `occupants` once unoccupied.
+
+        Raises
+        ------
+        ValueError
+            If the agent is not in that cell.
+        """
+        cell = self.level_matrix[r][c]
+        cell.remove(agent)
+        if not _is_occupied(cell):
+            self.occupants.pop((r, c), None)
+
     def find_agent(self, agent: Any) -> Optional[Tuple[int, int]]:
         """
         Locate an agent within the matrix.
@@ -67,10 +101,9 @@ class Environment:
         Optional[Tuple[int, int]]
             (row, col) if found, else None.
         """
-        for r, row in enumerate(self.level_matrix):
-            for c, cell in enumerate(row):
-                if agent in cell:
-                    return r, c
+        for pos, cell in self.occupants.items():
+            if agent in cell:
+                return pos
         return None
 
     # -----------------------------
@@ -103,12 +136,14 @@ class Environment:
 
         # Perform move
         try:
-            self.level_matrix[r][c].remove(agent)
+            self._remove_from_cell(agent, r, c)
         except ValueError:
             # Agent vanished between checks; treat as failed move.
             return False
 
-        self.level_matrix[nr][nc].append(agent)
+        target = self.level_matrix[nr][nc]
+        target.append(agent)
+        self.occupants[(nr, nc)] = target
 
         # Hook for visuals / tracing
         self._update_gui()
@@ -154,7 +189,7 @@ class Environment:
 
         r, c = pos
         try:
-            self.level_matrix[r][c].remove(agent)
+            self._remove_from_cell(agent, r, c)
         except ValueError:
             # Already removed or inconsistent state; ignore.
             pass
@@ -1,8 +1,16 @@
 import random
-from typing import Any, List, Optional, Sequence, Tuple
+from typing import Any, List, Optional, Sequence, Set
 
+import numpy as np
 
-def build_level(height: int, width: int, agents: Sequence[Any], rng: Optional[random.Random] = None) -> List[List[Optional[Any]]]:
+
+def build_level(
+    height: int,
+    width: int,
+    agents: Sequence[Any],
+    rng: Optional[random.Random] = None,
+    seed: Optional[int] = None,
+) -> List[List[Optional[Any]]]:
     """
     Minimal grid builder: randomly place agents on an empty matrix.
 
@@ -21,7 +29,10 @@ def build_level(height: int, width: int, agents: Sequence[Any], rng: Optional[ra
     agents : Sequence[Any]
         Agent objects to place. Each agent occupies exactly one cell.
     rng : Optional[random.Random]
-        Optional RNG for deterministic placements in tests. Defaults to `random`.
+        Optional RNG for deterministic placements in tests. The placement
+        seed is drawn from it. Defaults to `random`.
+    seed : Optional[int]
+        Optional seed for the placement sampler. Takes precedence over `rng`.
 
     Returns
     -------
@@ -48,12 +59,26 @@ def build_level(height: int, width: int, agents: Sequence[Any], rng: Optional[ra
     # Create an empty matrix
     matrix: List[List[Optional[Any]]] = [[None for _ in range(width)] for _ in range(height)]
 
-    # Generate a shuffled list of all cell coordinates; take the first N for agents
-    rng = rng or random
-    coords: List[Tuple[int, int]] = [(r, c) for r in range(height) for c in range(width)]
-    rng.shuffle(coords)
+    if num_agents * 4 < total_cells:
+        # Sparse grid: Floyd's algorithm draws N distinct flat indices in O(N)
+        sampler = random.Random(seed) if seed is not None else (rng or random)
+        chosen: Set[int] = set()
+        flat_idx: List[int] = []
+        for j in range(total_cells - num_agents, total_cells):
+            t = sampler.randrange(j + 1)
+            pick = j if t in chosen else t
+            chosen.add(pick)
+            flat_idx.append(pick)
+        # Floyd yields a uniform subset, not a uniform order
+        sampler.shuffle(flat_idx)
+    else:
+        # Dense grid: sample N distinct flat indices without materializing all coordinates
+        if seed is None:
+            seed = (rng or random).getrandbits(64)
+        flat_idx = np.random.default_rng(seed).choice(total_cells, size=num_agents, replace=False).tolist()
 
-    for agent, (r, c) in zip(agents, coords[:num_agents]):
+    for agent, fi in zip(agents, flat_idx):
+        r, c = divmod(fi, width)
         matrix[r][c] = agent
 
     return matrix
@@ -104,12 +104,15 @@ class Simulation:
                 agent.print_agent_actions = print_actions
                 self.agent_list.append(agent)
 
+        # Import all configured agent types once before per-agent instantiation
+        self.agent_type_returner.prewarm(self.agent_type_config)
+
         # Finalize ACT-R artifacts and back-references
         for agent in self.agent_list:
             agent.set_agent_dictionary(self.agent_list)
             ids = list(agent.get_agent_dictionary())
             actr_construct, actr_agent, actr_adapter = (
-                AgentTypeReturner().return_agent_type(
+                self.agent_type_returner.return_agent_type(
                     agent.actr_agent_type_name,
                     self.actr_environment,
                     ids,
@@ -16,14 +16,286 @@ Scope
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional, Sequence, Tuple
+from collections import defaultdict
+from functools import lru_cache
+from operator import attrgetter, itemgetter
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple
 
 import pyactr
 import pyactr.vision as vision
 from pyactr import chunks, utilities
+from pyactr.declarative import DecMem
 from pyactr.utilities import ACTRError
 
 
+# ---------------------------------------------------------------------------
+# Visual search helpers
+# ---------------------------------------------------------------------------
+
+# Stimulus keys that describe presentation rather than visual-location slots.
+_VIS_EXCLUDED_KEYS = frozenset(("position", "text", "vis_delay"))
+
+# Marker for request slots that exist but hold no value.
+_EMPTY = object()
+
+
+def _absolute_coordinate(slot: Any) -> Optional[int]:
+    """
+    Return the absolute screen coordinate requested by a search-chunk slot.
+
+    Returns ``None`` if the slot is empty or holds a relative constraint
+    such as ``"<3"``; those do not restrict the search.
+    """
+    try:
+        return int(slot.values) if slot.values else None
+    except (TypeError, ValueError, AttributeError):
+        return None
+
+
+def _is_constant_slot(value: Any) -> bool:
+    """
+    Return ``True`` if a search-chunk slot holds no (negated) variables.
+
+    Such slots resolve to themselves under ``check_bound_vars``.
+    """
+    return (
+        isinstance(value, utilities.VarvalClass)
+        and not value.variables
+        and not value.negvariables
+    )
+
+
+_position = itemgetter("position")
+
+
+def _stimulus_layout(stimulus: Dict[Any, Dict[str, Any]]) -> Tuple[Tuple[Any, ...], Tuple[Tuple[Any, ...], ...]]:
+    """
+    Return the stimulus keys and positions that a coordinate index depends on.
+
+    Runs at C speed (no per-stimulus Python code), so comparing layouts is
+    much cheaper than a scan. It catches stimuli that were added, removed,
+    reordered or moved, whether the dict was replaced or edited in place.
+    """
+    return tuple(stimulus), tuple(map(tuple, map(_position, stimulus.values())))
+
+
+class _StimulusIndex:
+    """
+    Screen-coordinate index over one stimulus layout.
+
+    Maps ``x``, ``y`` and ``(x, y)`` to stimulus keys in insertion order,
+    so a coordinate-constrained search visits candidates in the same order
+    as a full scan. ``layout`` is the :func:`_stimulus_layout` the index
+    was built from; the index is valid for any stimulus dict with an equal
+    layout.
+    """
+
+    __slots__ = ("layout", "by_x", "by_y", "by_xy")
+
+    def __init__(self, layout: Tuple[Tuple[Any, ...], Tuple[Tuple[Any, ...], ...]]) -> None:
+        self.layout = layout
+        self.by_x: Dict[int, List[Any]] = defaultdict(list)
+        self.by_y: Dict[int, List[Any]] = defaultdict(list)
+        self.by_xy: Dict[Tuple[int, int], List[Any]] = defaultdict(list)
+        for key, position in zip(*layout):
+            x, y = int(position[0]), int(position[1])
+            self.by_x[x].append(key)
+            self.by_y[y].append(key)
+            self.by_xy[(x, y)].append(key)
+
+    def candidates(self, want_x: Optional[int], want_y: Optional[int]) -> Sequence[Any]:
+        """Return the keys of stimuli that can satisfy the coordinate constraints."""
+        if want_x is not None and want_y is not None:
+            return self.by_xy.get((want_x, want_y), ())
+        if want_x is not None:
+            return self.by_x.get(want_x, ())
+        return self.by_y.get(want_y, ())
+
+
+def _stimulus_index(visual_location: Any, stimulus: Any) -> Optional[_StimulusIndex]:
+    """
+    Return the coordinate index for ``stimulus``, or ``None`` to scan.
+
+    Building the index costs more than one scan, and most layouts are
+    searched only once, so it is built on the second search against the
+    same layout. It is cached on the visual-location module and checked
+    against the current layout on every search, so stimuli edited in
+    place are never looked up at stale coordinates. Stimuli that cannot
+    be indexed (for example a malformed position) also yield ``None``;
+    callers then fall back to a full scan.
+    """
+    try:
+        layout = _stimulus_layout(stimulus)
+    except (KeyError, TypeError):
+        return None
+    index = getattr(visual_location, "_stim_index", None)
+    if index is not None and index.layout == layout:
+        return index
+    seen = getattr(visual_location, "_stim_seen", None)
+    visual_location._stim_seen = layout
+    if seen != layout:
+        return None
+    try:
+        index = _StimulusIndex(layout)
+    except (IndexError, TypeError, ValueError):
+        return None
+    visual_location._stim_index = index
+    return index
+
+
+# Plain-data slot values of an empty request, per _visuallocation chunk type.
+_empty_request_cache: Dict[Any, Dict[str, Any]] = {}
+
+
+def _empty_request_values() -> Dict[str, Any]:
+    """
+    Return the request slot values of a visual-location request without slots.
+
+    Built from an empty ``_visuallocation`` chunk once per definition of
+    that chunk type; callers must not mutate the result.
+    """
+    chunktype = chunks.Chunk._chunktypes.get(utilities.VISUALLOCATION)
+    request_values = _empty_request_cache.get(chunktype)
+    if request_values is None:
+        empty = chunks.Chunk(utilities.VISUALLOCATION)
+        request_values = {slot: getattr(value, "values", _EMPTY) for slot, value in empty}
+        _empty_request_cache.clear()
+        _empty_request_cache[chunks.Chunk._chunktypes.get(utilities.VISUALLOCATION)] = request_values
+    return request_values
+
+
+# Compiled stimulus predicates, keyed by request shape (see _find_predicate).
+_find_predicate_cache: Dict[Tuple[Any, ...], Callable[[Dict[str, Any], Any], Optional[Tuple[int, int]]]] = {}
+_FIND_PREDICATE_CACHE_SIZE = 1024
+
+
+def _compile_find_predicate(
+    request_values: Dict[str, Any],
+    want_x: Optional[int],
+    want_y: Optional[int],
+    check_text: bool,
+    want_text: Any,
+    want_attended: Optional[bool],
+) -> Callable[[Dict[str, Any], Any], Optional[Tuple[int, int]]]:
+    """
+    Generate a stimulus predicate with only the active constraints inlined.
+
+    The predicate ``pred(stim_attrs, recent)`` returns the stimulus screen
+    position ``(x, y)`` if it satisfies the request and ``None`` otherwise.
+    Its last step is the dict-level equivalent of
+    ``makechunk(**stim_attrs) <= request``: every stimulus attribute
+    (except presentation keys) must carry the value requested for that
+    slot; request slots the stimulus does not mention are not checked.
+    """
+    lines = ["def pred(stim_attrs, recent):"]
+    if want_attended is not None:
+        lines.append(f"    if (stim_attrs in recent) != {want_attended!r}: return None")
+    if check_text:
+        lines.append("    if WANT_TEXT != stim_attrs.get('text'): return None")
+    lines += [
+        "    position = stim_attrs['position']",
+        "    x = int(position[0])",
+        "    y = int(position[1])",
+    ]
+    if want_x is not None:
+        lines.append(f"    if x != {want_x!r}: return None")
+    if want_y is not None:
+        lines.append(f"    if y != {want_y!r}: return None")
+    if all(wanted is _EMPTY for wanted in request_values.values()):
+        # Unconstrained request: attributes pass only as empty values of known slots
+        lines += [
+            "    for key, value in stim_attrs.items():",
+            "        if key not in EXCLUDED and (key not in REQUEST or str(value) != 'None'): return None",
+        ]
+    else:
+        lines += [
+            "    for key, value in stim_attrs.items():",
+            "        if key in EXCLUDED: continue",
+            "        wanted = REQUEST.get(key)",
+            "        if wanted is EMPTY:",
+            "            # An empty request slot only accepts an empty stimulus value",
+            "            if str(value) != 'None': return None",
+            "        elif wanted != str(value): return None",
+        ]
+    lines.append("    return x, y")
+
+    namespace: Dict[str, Any] = {
+        "WANT_TEXT": want_text,
+        "REQUEST": request_values,
+        "EXCLUDED": _VIS_EXCLUDED_KEYS,
+        "EMPTY": _EMPTY,
+    }
+    exec(compile("\n".join(lines), "<patched_find predicate>", "exec"), namespace)
+    return namespace["pred"]
+
+
+def _request_shape(
+    request_values: Dict[str, Any],
+    want_x: Optional[int],
+    want_y: Optional[int],
+    check_text: bool,
+    want_text: Any,
+    want_attended: Optional[bool],
+) -> Optional[Tuple[Any, ...]]:
+    """
+    Return a hashable key describing a resolved visual-location request.
+
+    Returns ``None`` for requests with unhashable slot values; their
+    predicates are not cached.
+    """
+    shape = (tuple(sorted(request_values.items())), want_x, want_y, check_text, want_text, want_attended)
+    try:
+        hash(shape)
+    except TypeError:
+        return None
+    return shape
+
+
+def _find_predicate(
+    shape: Optional[Tuple[Any, ...]],
+    request_values: Dict[str, Any],
+    want_x: Optional[int],
+    want_y: Optional[int],
+    check_text: bool,
+    want_text: Any,
+    want_attended: Optional[bool],
+) -> Callable[[Dict[str, Any], Any], Optional[Tuple[int, int]]]:
+    """
+    Return the compiled predicate for a request shape, compiling on first use.
+
+    ``shape`` is the request's :func:`_request_shape` key; requests without
+    one are compiled but not cached.
+    """
+    pred = _find_predicate_cache.get(shape) if shape is not None else None
+    if pred is None:
+        pred = _compile_find_predicate(request_values, want_x, want_y, check_text, want_text, want_attended)
+        if shape is not None:
+            if len(_find_predicate_cache) >= _FIND_PREDICATE_CACHE_SIZE:
+                _find_predicate_cache.clear()
+            _find_predicate_cache[shape] = pred
+    return pred
+
+
+def _iter_matches(
+    stimulus: Dict[Any, Dict[str, Any]],
+    candidates: Any,
+    matches: Callable[[Dict[str, Any], Any], Optional[Tuple[int, int]]],
+    recent: Any,
+) -> Iterator[Tuple[Dict[str, Any], Tuple[int, int]]]:
+    """Yield ``(stimulus_dict, (x, y))`` for every candidate accepted by ``matches``."""
+    for each in candidates:
+        stim_attrs = stimulus[each]
+        position = matches(stim_attrs, recent)
+        if position is not None:
+            yield stim_attrs, position
+
+
+# ---------------------------------------------------------------------------
+# pyACT-R patches
+# ---------------------------------------------------------------------------
+
+
 def fix_pyactr() -> None:
     """
     Monkey-patch pyACT-R's :class:`VisualLocation` search routine.
@@ -38,6 +310,9 @@ def fix_pyactr() -> None:
     * treats screen coordinates as absolute constraints when provided, and
     * synthesizes well-formed ``_visuallocation`` chunks for matches.
 
+    It also adds :meth:`VisualLocation.find_all`, which returns every
+    match. Both run the same lazy search; ``find`` stops at the first match.
+
     Notes
     -----
     This function mutates the global pyACT-R class definition
@@ -46,6 +321,99 @@ def fix_pyactr() -> None:
     """
     _original_find = vision.VisualLocation.find  # kept for potential restoration
 
+    def search(
+        self,
+        otherchunk,
+        actrvariables,
+        extra_tests,
+        *,
+        _Chunk=chunks.Chunk,
+        _VL=utilities.VISUALLOCATION,
+        _check=utilities.check_bound_vars,
+        _ACTRError=ACTRError,
+        _is_constant=_is_constant_slot,
+        _coordinate=_absolute_coordinate,
+    ) -> Iterator[Tuple[Dict[str, Any], Tuple[int, int]]]:
+        """
+        Resolve a request and return a lazy iterator over its matches.
+
+        The keyword-only arguments bind module globals as locals for the
+        search path; callers never pass them.
+        """
+        if extra_tests is None:
+            extra_tests = {}
+        if actrvariables is None:
+            actrvariables = {}
+
+        used_slots = otherchunk.removeunused()
+        if not used_slots:
+            # Empty request: no slot constraints, so no search chunk is needed
+            want_x = want_y = want_text = None
+            check_text = False
+            request_values = _empty_request_values()
+        else:
+            # Resolve all attributes from the production RHS pattern.
+            # Constant-only patterns (the common case) need no variable binding.
+            if all(_is_constant(value) for _, value in used_slots):
+                mod_attr_val = dict(used_slots)
+            else:
+                try:
+                    mod_attr_val = {
+                        x[0]: _check(actrvariables, x[1], negative_impossible=False)
+                        for x in used_slots
+                    }
+                except _ACTRError as e:
+                    raise _ACTRError(f"The chunk '{otherchunk}' is not defined correctly; {e}")
+            chunk_used_for_search = _Chunk(_VL, **mod_attr_val)
+
+            # Resolve the search constraints once, not per stimulus.
+            # Absolute screen coordinates; relative ("<3") or empty slots impose no constraint.
+            want_x = _coordinate(chunk_used_for_search.screen_x)
+            want_y = _coordinate(chunk_used_for_search.screen_y)
+
+            # Optional text-value filter
+            check_text = chunk_used_for_search.value != chunk_used_for_search.EmptyValue()
+            want_text = chunk_used_for_search.value.values if check_text else None
+
+            # Request slot values as plain data for the per-stimulus compatibility test
+            request_values = {slot: getattr(value, "values", _EMPTY) for slot, value in chunk_used_for_search}
+
+        # Attended flag as a tri-state: True (attended), False (unattended), None (any).
+        # FINST history only constrains the search while FINSTs are enabled.
+        attended_flag = extra_tests.get("attended") if self.finst else None
+        if attended_flag in (False, "False"):
+            want_attended: Optional[bool] = False
+        elif attended_flag is not None:
+            want_attended = True
+        else:
+            want_attended = None
+
+        shape = _request_shape(request_values, want_x, want_y, check_text, want_text, want_attended)
+        matches = _find_predicate(shape, request_values, want_x, want_y, check_text, want_text, want_attended)
+        stimulus = self.environment.stimulus
+
+        # Coordinate-constrained searches only visit stimuli at those coordinates
+        candidates = stimulus
+        if want_x is not None or want_y is not None:
+            index = _stimulus_index(self, stimulus)
+            if index is not None:
+                candidates = index.candidates(want_x, want_y)
+
+        return _iter_matches(stimulus, candidates, matches, self.recent)
+
+    def visual_location(
+        stim_attrs,
+        position,
+        *,
+        _Chunk=chunks.Chunk,
+        _VL=utilities.VISUALLOCATION,
+        _excluded=_VIS_EXCLUDED_KEYS,
+    ):
+        """Build the ``_visuallocation`` chunk for a matched stimulus."""
+        temp_dict = {k: v for k, v in stim_attrs.items() if k not in _excluded}
+        temp_dict["screen_x"], temp_dict["screen_y"] = position
+        return _Chunk(_VL, **temp_dict)
+
     def patched_find(self, otherchunk, actrvariables=None, extra_tests=None):
         """
         Search for a visual stimulus that matches the request chunk.
@@ -69,89 +437,31 @@ def fix_pyactr() -> None:
             match is found, and the second element is the raw stimulus
             dictionary from the environment or ``None``.
         """
-        if extra_tests is None:
-            extra_tests = {}
-        if actrvariables is None:
-            actrvariables = {}
+        match = next(search(self, otherchunk, actrvariables, extra_tests), None)
+        if match is None:
+            return None, None
+        stim_attrs, position = match
+        return visual_location(stim_attrs, position), stim_attrs
 
-        # Resolve all attributes from the production RHS pattern
-        try:
-            mod_attr_val = {
-                x[0]: utilities.check_bound_vars(actrvariables, x[1], negative_impossible=False)
-                for x in otherchunk.removeunused()
-            }
-        except ACTRError as e:
-            raise ACTRError(f"The chunk '{otherchunk}' is not defined correctly; {e}")
-        chunk_used_for_search = chunks.Chunk(utilities.VISUALLOCATION, **mod_attr_val)
-
-        found, found_stim = None, None
-
-        # Iterate over all stimuli present in the environment
-        for each in self.environment.stimulus:
-            stim_attrs = self.environment.stimulus[each]
-
-            # Enforce attended flag and FINST history
-            attended_flag = extra_tests.get("attended", None)
-            if attended_flag in (False, "False"):
-                # Request: unattended item
-                if self.finst and stim_attrs in self.recent:
-                    continue
-            elif attended_flag not in (False, "False") and attended_flag is not None:
-                # Request: attended item
-                if self.finst and stim_attrs not in self.recent:
-                    continue
+    def patched_find_all(self, otherchunk, actrvariables=None, extra_tests=None):
+        """
+        Return every visual stimulus that matches the request chunk.
 
-            # Optional text-value filter
-            if (
-                chunk_used_for_search.value != chunk_used_for_search.EmptyValue()
-                and chunk_used_for_search.value.values != stim_attrs.get("text")
-            ):
-                continue
-
-            # Extract pixel coordinates
-            position = (int(stim_attrs["position"][0]), int(stim_attrs["position"][1]))
-
-            # Screen coordinate constraints (absolute equality)
-            try:
-                if (
-                    chunk_used_for_search.screen_x.values
-                    and int(chunk_used_for_search.screen_x.values) != position[0]
-                ):
-                    continue
-            except (TypeError, ValueError, AttributeError):
-                pass
-            try:
-                if (
-                    chunk_used_for_search.screen_y.values
-                    and int(chunk_used_for_search.screen_y.values) != position[1]
-                ):
-                    continue
-            except (TypeError, ValueError, AttributeError):
-                pass
-
-            # Build a visible-location chunk from the stimulus attributes
-            found_stim = stim_attrs
-            filtered = {
-                k: stim_attrs[k]
-                for k in stim_attrs
-                if k not in ("position", "text", "vis_delay")
-            }
-            visible_chunk = chunks.makechunk(
-                nameofchunk="vis1",
-                typename="_visuallocation",
-                **filtered,
-            )
-
-            # Check for structural compatibility with the query chunk
-            if visible_chunk <= chunk_used_for_search:
-                temp_dict = visible_chunk._asdict()
-                temp_dict.update({"screen_x": position[0], "screen_y": position[1]})
-                found = chunks.Chunk(utilities.VISUALLOCATION, **temp_dict)
-                break  # return first compatible match
-
-        return found, found_stim
+        Takes the same arguments as :meth:`VisualLocation.find`.
+
+        Returns
+        -------
+        list of tuple
+            ``(visuallocation_chunk, stimulus_dict)`` pairs in stimulus
+            order; empty if nothing matches.
+        """
+        return [
+            (visual_location(stim_attrs, position), stim_attrs)
+            for stim_attrs, position in search(self, otherchunk, actrvariables, extra_tests)
+        ]
 
     vision.VisualLocation.find = patched_find
+    vision.VisualLocation.find_all = patched_find_all
 
 
 # ---------------------------------------------------------------------------
@@ -159,6 +469,38 @@ def fix_pyactr() -> None:
 # ---------------------------------------------------------------------------
 
 
+# Action prefixes of pyACT-R's procedural and manual trace events.
+_RULE_FIRED_PREFIX = "RULE FIRED: "
+_KEY_PRESSED_PREFIX = "KEY PRESSED:"
+
+
+def _event_module_action(event: Any) -> Tuple[Any, Any]:
+    """
+    Return ``(module, action)`` of a simulation event.
+
+    pyACT-R events are ``(time, proc, action)`` named tuples; other event
+    objects are read through ``module``/``action`` attributes with an
+    index fallback. Missing fields come back as ``None``.
+    """
+    if isinstance(event, tuple) and len(event) >= 3:
+        return event[1], event[2]
+
+    module = getattr(event, "module", None)
+    if module is None:
+        try:
+            module = event[1]
+        except Exception:
+            module = None
+
+    action = getattr(event, "action", None)
+    if action is None:
+        try:
+            action = event[2]
+        except Exception:
+            action = None
+    return module, action
+
+
 def request_if_production_fired(agent_construct: Any) -> bool:
     """
     Determine whether the current event corresponds to a fired production.
@@ -198,17 +540,9 @@ def get_production_fired(agent: Any) -> Optional[str]:
     except AttributeError:
         return None
 
-    # pyactr events typically expose the action both as attribute
-    # and as tuple index.
-    action = getattr(event, "action", None)
-    if action is None:
-        try:
-            action = event[2]
-        except Exception:
-            return None
-
-    if isinstance(action, str) and "RULE FIRED: " in action:
-        return action.replace("RULE FIRED: ", "")
+    _, action = _event_module_action(event)
+    if isinstance(action, str) and action.startswith(_RULE_FIRED_PREFIX):
+        return action[len(_RULE_FIRED_PREFIX):]
     return None
 
 
@@ -250,21 +584,8 @@ def key_pressed(agent_construct: Any) -> Optional[str]:
     except AttributeError:
         return None
 
-    module = getattr(event, "module", None)
-    if module is None:
-        try:
-            module = event[1]
-        except Exception:
-            module = None
-
-    action = getattr(event, "action", None)
-    if action is None:
-        try:
-            action = event[2]
-        except Exception:
-            return None
-
-    if module == "manual" and isinstance(action, str) and "KEY PRESSED:" in action:
+    module, action = _event_module_action(event)
+    if module == "manual" and isinstance(action, str) and action.startswith(_KEY_PRESSED_PREFIX):
         # For simple alphanumeric keys the last character is the key;
         # for multi-character labels (for example "SPACE") this preserves
         # the previous behavior by returning the last character.
@@ -299,6 +620,9 @@ def set_goal(agent_construct: Any, chunk: chunks.Chunk) -> None:
     """
     Insert a chunk into the primary goal buffer.
 
+    The buffer is looked up under key ``"g"`` as in :func:`get_goal`;
+    models without it fall back to their first goal buffer.
+
     Parameters
     ----------
     agent_construct :
@@ -306,8 +630,11 @@ def set_goal(agent_construct: Any, chunk: chunks.Chunk) -> None:
     chunk : Chunk
         :class:`pyactr.chunks.Chunk` instance to be added to the goal buffer.
     """
-    first_goal = next(iter(agent_construct.actr_agent.goals.values()))
-    first_goal.add(chunk)
+    goals = agent_construct.actr_agent.goals
+    goal = goals.get("g")
+    if goal is None:
+        goal = next(iter(goals.values()))
+    goal.add(chunk)
 
 
 def get_imaginal(agent_construct: Any, key: str):
@@ -369,6 +696,34 @@ def set_imaginal(agent_construct: Any, new_chunk: chunks.Chunk, key: str) -> Non
 # ---------------------------------------------------------------------------
 
 
+@lru_cache(maxsize=256)
+def _parse_production(string: str) -> Callable[[], Iterator[Dict[str, Any]]]:
+    """
+    Parse a production string once and return its rule factory.
+
+    Parsing happens on a throwaway model; the factory only depends on
+    ``string`` and can therefore be shared between agents. pyACT-R builds
+    the rule's chunks lazily, so both sides are built once here: rules
+    that parse but are malformed raise now and are never cached.
+    """
+    rule = pyactr.ACTRModel().productionstring(name="template", string=string)["rule"]
+    for _ in rule():
+        pass
+    return rule
+
+
+def _copying_rule(template: Callable[[], Iterator[Dict[str, Any]]]):
+    """
+    Wrap a shared rule factory so each caller gets its own LHS/RHS dicts.
+
+    pyACT-R's factory refills the same two dicts on every call.
+    """
+    def rule():
+        for side in template():
+            yield dict(side)
+    return rule
+
+
 def update_utility(agent_construct: Any, production_name: str, utility: float) -> None:
     """
     Set the utility value of an existing production.
@@ -405,10 +760,10 @@ def get_production_utility(
         Utility value, or ``None`` if the production or its utility
         entry does not exist.
     """
-    try:
-        return agent_construct.actr_agent.productions[production_name]["utility"]
-    except KeyError:
+    production = agent_construct.actr_agent.productions.get(production_name)
+    if production is None:
         return None
+    return production.get("utility")
 
 
 def add_production(
@@ -436,12 +791,43 @@ def add_production(
         Initial utility value. If ``None``, the pyACT-R default is used.
     """
     model = agent_construct.actr_agent
-    model.productionstring(name=name, string=string)
+    productions = model.productions
+    try:
+        template = _parse_production(string) if name else None
+    except Exception:
+        template = None
+    if template is None:
+        # Unnamed, unparsable or malformed rules take pyACT-R's own path,
+        # so that naming, error messages and their timing stay unchanged.
+        model.productionstring(name=name, string=string)
+    else:
+        productions.update(
+            {name: {"rule": _copying_rule(template), "utility": 0, "reward": None}}
+        )
     if utility is not None:
-        update_utility(agent_construct, name, utility)
+        productions[name]["utility"] = utility
 
 
-def get_all_productions(agent_construct: Any) -> Dict[str, Dict[str, Any]]:
+def get_all_productions(agent_construct: Any) -> Mapping[str, Any]:
+    """
+    Return a read-only live view of the internal production structure.
+
+    Parameters
+    ----------
+    agent_construct :
+        Wrapper exposing ``agent_construct.actr_agent``.
+
+    Returns
+    -------
+    Mapping
+        Mapping from production names to their metadata dictionaries.
+        The view reflects later changes to the model; use
+        :func:`copy_productions` for a snapshot that can be mutated.
+    """
+    return MappingProxyType(agent_construct.actr_agent.productions)
+
+
+def copy_productions(agent_construct: Any) -> Dict[str, Any]:
     """
     Return a shallow copy of the internal production structure.
 
@@ -464,6 +850,108 @@ def get_all_productions(agent_construct: Any) -> Dict[str, Dict[str, Any]]:
 # ---------------------------------------------------------------------------
 
 
+_typename = attrgetter("typename")
+
+
+class _VersionedDecMem(DecMem):
+    """
+    :class:`pyactr.declarative.DecMem` that counts changes to its set of chunks.
+
+    Installed on an agent's memory by :func:`track_declarative_memory`, so
+    the typename index notices every insertion or deletion, including
+    pyACT-R's own buffer harvests, in O(1). Re-adding a known chunk (a new
+    presentation time) does not count as a change.
+    """
+
+    _key_version = 0
+
+    def __setitem__(self, key, time):
+        try:
+            new = key not in self
+        except TypeError:
+            new = True
+        super().__setitem__(key, time)
+        if new:
+            self._key_version += 1
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self._key_version += 1
+
+
+def track_declarative_memory(actr_agent: Any) -> bool:
+    """
+    Make the agent's declarative memory count changes to its chunks.
+
+    Call once after the model is built. The memory object keeps its
+    identity (buffers and the retrieval module hold references to it);
+    only its class becomes a change-counting ``DecMem`` subclass. Without
+    it, the typename index below is rebuilt on every query.
+
+    Parameters
+    ----------
+    actr_agent :
+        The pyACT-R model (``ACTRModel``) whose ``decmem`` to track.
+
+    Returns
+    -------
+    bool
+        ``True`` if the memory is tracked, ``False`` for memory objects
+        that cannot be (anything but a plain ``DecMem``).
+    """
+    dm = getattr(actr_agent, "decmem", None)
+    if type(dm) is DecMem:
+        dm.__class__ = _VersionedDecMem
+    return isinstance(dm, _VersionedDecMem)
+
+
+class _DMTypeIndex:
+    """
+    Typename → chunks index over one declarative memory.
+
+    Chunks are kept as keys of insertion-ordered dicts so lookups return
+    them in memory order. ``version`` is the memory's change counter at
+    the last update; any other value means the index is stale.
+    """
+
+    __slots__ = ("dm", "version", "by_type")
+
+    def __init__(self, dm: Any, version: Optional[int]) -> None:
+        self.dm = dm
+        self.version = version
+        by_type: Dict[Any, Dict[Any, None]] = defaultdict(dict)
+        # In pyactr, the declarative memory is dict-like with chunks as keys.
+        try:
+            for chunk in dm:
+                by_type[_typename(chunk)][chunk] = None
+        except AttributeError:
+            # Some key is not a chunk; rescan with a defaulting lookup.
+            by_type = defaultdict(dict)
+            for chunk in dm:
+                by_type[getattr(chunk, "typename", None)][chunk] = None
+        self.by_type = by_type
+
+    def is_current(self, dm: Any) -> bool:
+        """Return ``True`` if the index still describes ``dm``."""
+        return self.dm is dm and self.version is not None and self.version == getattr(dm, "_key_version", None)
+
+
+def _dm_type_index(agent_construct: Any) -> _DMTypeIndex:
+    """
+    Return the typename index for the agent's declarative memory.
+
+    Built by one full scan on first use and cached on ``agent_construct``;
+    rebuilt once the memory object was replaced or its chunks changed
+    outside the helpers below.
+    """
+    dm = agent_construct.actr_agent.decmem
+    index = getattr(agent_construct, "_dm_type_index", None)
+    if index is None or not index.is_current(dm):
+        index = _DMTypeIndex(dm, getattr(dm, "_key_version", None))
+        agent_construct._dm_type_index = index
+    return index
+
+
 def get_declarative_memory(agent_construct: Any):
     """
     Return the agent's declarative memory (ACTRDM instance).
@@ -492,7 +980,14 @@ def add_to_declarative_memory(agent_construct: Any, chunk: chunks.Chunk) -> None
     chunk : Chunk
         :class:`pyactr.chunks.Chunk` to be stored.
     """
-    agent_construct.actr_agent.decmem.add(chunk)
+    dm = agent_construct.actr_agent.decmem
+    index = getattr(agent_construct, "_dm_type_index", None)
+    current = index is not None and index.is_current(dm)
+    dm.add(chunk)
+    # Keep an up-to-date index in step; a stale one is rebuilt on the next query
+    if current and isinstance(chunk, chunks.Chunk):
+        index.by_type[getattr(chunk, "typename", None)][chunk] = None
+        index.version = dm._key_version
 
 
 def get_declarative_chunk_type(agent_construct: Any, typename: str):
@@ -512,9 +1007,7 @@ def get_declarative_chunk_type(agent_construct: Any, typename: str):
         All chunks in declarative memory whose ``typename`` matches
         ``typename``.
     """
-    dm = agent_construct.actr_agent.decmem
-    # In pyactr, the declarative memory is dict-like with chunks as keys.
-    return [chunk for chunk in dm.keys() if getattr(chunk, "typename", None) == typename]
+    return list(_dm_type_index(agent_construct).by_type.get(typename, ()))
 
 
 def delete_declarative_chunk_type(agent_construct: Any, typename: str) -> int:
@@ -533,11 +1026,15 @@ def delete_declarative_chunk_type(agent_construct: Any, typename: str) -> int:
     int
         Number of deleted chunks.
     """
-    dm = agent_construct.actr_agent.decmem
-    to_delete = [chunk for chunk in dm.keys() if getattr(chunk, "typename", None) == typename]
-    for chunk in to_delete:
-        del dm[chunk]
-    return len(to_delete)
+    index = _dm_type_index(agent_construct)
+    dm = index.dm
+    deleted = 0
+    for chunk in index.by_type.pop(typename, {}):
+        if chunk in dm:
+            del dm[chunk]
+            deleted += 1
+    index.version = getattr(dm, "_key_version", None)
+    return deleted
 
 
 # ---------------------------------------------------------------------------
@@ -571,13 +1068,8 @@ def build_chunkstring_by_tuples(pairs: Sequence[Tuple[str, Any]]):
     if not pairs:
         raise ValueError("At least one (slot, value) tuple is required to build a chunk.")
 
-    lines: List[str] = []
-    for slot, value in pairs:
-        # pyactr.chunkstring expects a simple "slot value" syntax per line.
-        # Values are converted to strings; quoting for multi-word values
-        # must be handled by the caller if required.
-        val_str = "None" if value is None else str(value)
-        lines.append(f"{slot} {val_str}")
-
-    chunk_spec = "\n".join(lines)
+    # pyactr.chunkstring expects a simple "slot value" syntax per line.
+    # Values are formatted with str() (None becomes "None"); quoting for
+    # multi-word values must be handled by the caller if required.
+    chunk_spec = "\n".join(f"{slot} {value}" for slot, value in pairs)
     return pyactr.chunkstring(string=chunk_spec)
@@ -0,0 +1,277 @@
+"""
+Tests for the pyACT-R extension layer.
+
+Covers the patched visual search (``VisualLocation.find`` / ``find_all``)
+against a reference port of the original scan, its coordinate index under
+in-place stimulus edits, and the cached production templates used by
+``add_production``.
+
+Run from the repository root with ``python -m unittest`` (or pytest).
+"""
+
+import random
+import unittest
+import warnings
+from types import SimpleNamespace
+
+import pyactr
+import pyactr.vision as vision
+from pyactr import chunks, utilities
+from pyactr.utilities import ACTRError
+
+from simulation import pyactrFunctionalityExtension as ext
+
+
+def _reference_find(self, otherchunk, actrvariables=None, extra_tests=None):
+    """The original per-stimulus scan of ``fix_pyactr``, kept as the behavioural reference."""
+    extra_tests = extra_tests or {}
+    actrvariables = actrvariables or {}
+    try:
+        mod_attr_val = {
+            x[0]: utilities.check_bound_vars(actrvariables, x[1], negative_impossible=False)
+            for x in otherchunk.removeunused()
+        }
+    except ACTRError as e:
+        raise ACTRError(f"The chunk '{otherchunk}' is not defined correctly; {e}")
+    request = chunks.Chunk(utilities.VISUALLOCATION, **mod_attr_val)
+
+    for each in self.environment.stimulus:
+        stim_attrs = self.environment.stimulus[each]
+        attended_flag = extra_tests.get("attended", None)
+        if attended_flag in (False, "False"):
+            if self.finst and stim_attrs in self.recent:
+                continue
+        elif attended_flag is not None:
+            if self.finst and stim_attrs not in self.recent:
+                continue
+        if request.value != request.EmptyValue() and request.value.values != stim_attrs.get("text"):
+            continue
+        position = (int(stim_attrs["position"][0]), int(stim_attrs["position"][1]))
+        try:
+            if request.screen_x.values and int(request.screen_x.values) != position[0]:
+                continue
+        except (TypeError, ValueError, AttributeError):
+            pass
+        try:
+            if request.screen_y.values and int(request.screen_y.values) != position[1]:
+                continue
+        except (TypeError, ValueError, AttributeError):
+            pass
+        filtered = {k: v for k, v in stim_attrs.items() if k not in ("position", "text", "vis_delay")}
+        visible_chunk = chunks.makechunk(nameofchunk="vis1", typename="_visuallocation", **filtered)
+        if visible_chunk <= request:
+            temp_dict = visible_chunk._asdict()
+            temp_dict.update({"screen_x": position[0], "screen_y": position[1]})
+            return chunks.Chunk(utilities.VISUALLOCATION, **temp_dict), stim_attrs
+    return None, None
+
+
+def _scene(stimulus, finst=4, recent=()):
+    """Return a stand-in for a visual-location module looking at ``stimulus``."""
+    return SimpleNamespace(
+        environment=SimpleNamespace(stimulus=stimulus),
+        finst=finst,
+        recent=list(recent),
+    )
+
+
+def _request(*slots):
+    """Return a ``_visuallocation`` request chunk from ``"slot value"`` lines."""
+    return chunks.chunkstring(string="\n".join(("isa _visuallocation",) + slots))
+
+
+def _outcome(find, scene, request, actrvariables=None, extra_tests=None):
+    """Run ``find`` and reduce the result to comparable data."""
+    try:
+        found, stim_attrs = find(
+            scene,
+            request,
+            dict(actrvariables or {}),
+            None if extra_tests is None else dict(extra_tests),
+        )
+    except Exception as e:
+        return "error", type(e).__name__
+    if found is None:
+        return None
+    # The reference fills unset slots with None, the patched search leaves them empty
+    return repr(found).replace("= None", "= "), id(stim_attrs)
+
+
+class VisualSearchTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        warnings.simplefilter("ignore")
+        ext.fix_pyactr()
+        cls.find = staticmethod(vision.VisualLocation.find)
+        cls.find_all = staticmethod(vision.VisualLocation.find_all)
+
+    # ------------------------------------------------------------------
+    # FINST history
+    # ------------------------------------------------------------------
+    def test_attended_any_request_ignores_finst_history(self):
+        first = {"text": "A", "position": (0, 0)}
+        second = {"text": "B", "position": (1, 0)}
+        scene = _scene({0: first, 1: second}, recent=[first])
+
+        _, stim_attrs = self.find(scene, _request())
+        self.assertIs(stim_attrs, first)
+
+    def test_unattended_request_returns_first_stimulus_outside_finst_history(self):
+        first = {"text": "A", "position": (0, 0)}
+        second = {"text": "B", "position": (1, 0)}
+        third = {"text": "C", "position": (2, 0)}
+        scene = _scene({0: first, 1: second, 2: third}, recent=[first, third])
+
+        _, stim_attrs = self.find(scene, _request(), extra_tests={"attended": False})
+        self.assertIs(stim_attrs, second)
+        _, stim_attrs = self.find(scene, _request(), extra_tests={"attended": True})
+        self.assertIs(stim_attrs, first)
+
+        # Without FINSTs the attended flag imposes no constraint
+        scene.finst = 0
+        _, stim_attrs = self.find(scene, _request(), extra_tests={"attended": False})
+        self.assertIs(stim_attrs, first)
+
+    # ------------------------------------------------------------------
+    # Equivalence with the original scan
+    # ------------------------------------------------------------------
+    def test_matches_reference_search(self):
+        rng = random.Random(20240)
+        texts = ["A", "B", "C"]
+        for _ in range(150):
+            stimulus = {}
+            for key in range(rng.randrange(0, 12)):
+                stim_attrs = {"text": rng.choice(texts), "position": (rng.randrange(4), rng.randrange(4))}
+                if rng.random() < 0.3:
+                    stim_attrs["color"] = rng.choice(["red", "blue", 3, None])
+                if rng.random() < 0.2:
+                    stim_attrs["vis_delay"] = 1
+                stimulus[key] = stim_attrs
+            scene = _scene(
+                stimulus,
+                finst=rng.choice([0, 4]),
+                recent=[s for s in stimulus.values() if rng.random() < 0.4],
+            )
+
+            # Several requests per scene, so the coordinate index gets built and reused
+            for _ in range(4):
+                slots = []
+                if rng.random() < 0.5:
+                    slots.append("screen_x " + rng.choice(["0", "1", "2", "3", "<2", ">1", "=x"]))
+                if rng.random() < 0.5:
+                    slots.append("screen_y " + rng.choice(["0", "1", "2", "3", "=y"]))
+                if rng.random() < 0.4:
+                    slots.append("value " + rng.choice(texts + ["=t"]))
+                if rng.random() < 0.3:
+                    slots.append("color " + rng.choice(["red", "blue", "3", "~red"]))
+                request = _request(*slots)
+                actrvariables = {"=x": str(rng.randrange(4)), "=y": str(rng.randrange(4)), "=t": rng.choice(texts)}
+                extra_tests = rng.choice([None, {}, {"attended": True}, {"attended": False}, {"attended": "False"}])
+
+                with self.subTest(stimulus=stimulus, request=str(request), extra_tests=extra_tests):
+                    self.assertEqual(
+                        _outcome(self.find, scene, request, actrvariables, extra_tests),
+                        _outcome(_reference_find, scene, request, actrvariables, extra_tests),
+                    )
+
+                # Move a stimulus in place between requests
+                if stimulus and rng.random() < 0.5:
+                    stimulus[rng.choice(list(stimulus))]["position"] = (rng.randrange(4), rng.randrange(4))
+
+    def test_find_all_returns_every_match_in_stimulus_order(self):
+        stimulus = {
+            0: {"text": "A", "position": (0, 1)},
+            1: {"text": "B", "position": (1, 1)},
+            2: {"text": "A", "position": (2, 1)},
+        }
+        scene = _scene(stimulus)
+
+        matches = self.find_all(scene, _request("value A"))
+        self.assertEqual([stim_attrs for _, stim_attrs in matches], [stimulus[0], stimulus[2]])
+        self.assertEqual([(str(c.screen_x), str(c.screen_y)) for c, _ in matches], [("0", "1"), ("2", "1")])
+        self.assertEqual(self.find_all(scene, _request("value Z")), [])
+
+    # ------------------------------------------------------------------
+    # In-place edits between searches
+    # ------------------------------------------------------------------
+    def test_coordinate_search_follows_stimuli_moved_in_place(self):
+        stimulus = {key: {"text": "A", "position": (key, key)} for key in range(3)}
+        scene = _scene(stimulus)
+        for _ in range(3):  # builds the coordinate index
+            _, stim_attrs = self.find(scene, _request("screen_x 1"))
+            self.assertIs(stim_attrs, stimulus[1])
+
+        stimulus[1]["position"] = (2, 2)
+        stimulus[0]["position"] = (1, 0)
+        found, stim_attrs = self.find(scene, _request("screen_x 1"))
+        self.assertIs(stim_attrs, stimulus[0])
+        self.assertEqual((str(found.screen_x), str(found.screen_y)), ("1", "0"))
+
+        del stimulus[0]
+        self.assertEqual(self.find(scene, _request("screen_x 1")), (None, None))
+
+    def test_search_sees_text_changed_in_place(self):
+        stimulus = {0: {"text": "A", "position": (0, 0)}, 1: {"text": "B", "position": (1, 0)}}
+        scene = _scene(stimulus)
+        _, stim_attrs = self.find(scene, _request("value A"))
+        self.assertIs(stim_attrs, stimulus[0])
+
+        stimulus[0]["text"] = "C"
+        self.assertEqual(self.find(scene, _request("value A")), (None, None))
+        self.assertEqual(self.find_all(scene, _request("value A")), [])
+
+
+class AddProductionTest(unittest.TestCase):
+    RULE = "\n".join((
+        "=g>",
+        "isa goal",
+        "state start",
+        "==>",
+        "=g>",
+        "isa goal",
+        "state done",
+    ))
+
+    @classmethod
+    def setUpClass(cls):
+        warnings.simplefilter("ignore")
+        pyactr.chunktype("goal", "state")
+
+    def _agent(self):
+        return SimpleNamespace(actr_agent=pyactr.ACTRModel())
+
+    def test_agents_share_parsed_template(self):
+        first, second = self._agent(), self._agent()
+        ext.add_production(first, "advance", self.RULE, utility=2.0)
+        parsed = ext._parse_production.cache_info().currsize
+        ext.add_production(second, "advance", self.RULE)
+        self.assertEqual(ext._parse_production.cache_info().currsize, parsed)
+
+        self.assertEqual(ext.get_production_utility(first, "advance"), 2.0)
+        self.assertEqual(ext.get_production_utility(second, "advance"), 0)
+
+        reference = pyactr.ACTRModel().productionstring(name="advance", string=self.RULE)
+        expected = [str(side) for side in reference["rule"]()]
+        first_sides = list(first.actr_agent.productions["advance"]["rule"]())
+        second_sides = list(second.actr_agent.productions["advance"]["rule"]())
+        self.assertEqual([str(side) for side in first_sides], expected)
+        self.assertEqual([str(side) for side in second_sides], expected)
+
+        # Each call yields its own dicts; editing one agent's copy leaves the other intact
+        first_sides[0].clear()
+        self.assertEqual([str(side) for side in second.actr_agent.productions["advance"]["rule"]()], expected)
+
+    def test_malformed_rule_reports_its_own_name(self):
+        malformed = self.RULE.replace("state start", "state start\nstate again")
+        agent = self._agent()
+        ext.add_production(agent, "broken_rule", malformed)
+
+        with self.assertRaises(ACTRError) as raised:
+            for _ in agent.actr_agent.productions["broken_rule"]["rule"]():
+                pass
+        self.assertIn("broken_rule", str(raised.exception))
+        self.assertNotIn("template", str(raised.exception))
+
+
+if __name__ == "__main__":
+    unittest.main()